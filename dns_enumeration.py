@@ -7,14 +7,22 @@ GitHub: https://github.com/3UN014/subdomain-enumeration
 """
 
 import dns.resolver
+import dns.asyncresolver
 import argparse
+import asyncio
 import json
 import csv
 import sys
 from datetime import datetime
 
+# orjson serializes several times faster than stdlib json; fall back if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def print_banner():
-    """Display tool banner"""  https://github.com/3UN014/subdomain-enumeration
+    """Display tool banner"""
     banner = """
 ╔══════════════════════════════════════════════╗
 ║            DNS Enumeration Tool              ║
@@ -24,73 +32,90 @@ def print_banner():
     """
     print(banner)
 
+async def _enum_async(target_domain, record_types):
+    """
+    Query all record types concurrently and return the raw answers
+
+    Args:
+        target_domain (str): Domain to enumerate
+        record_types (list): Record types to query
+
+    Returns:
+        list: One Answer (or exception) per record type, in order
+    """
+    resolver = dns.asyncresolver.Resolver()
+    resolver.timeout = 10
+    resolver.lifetime = 30
+    # Cache answers so CNAME chains and repeated targets aren't re-fetched
+    resolver.cache = dns.resolver.LRUCache(max_size=1024)
+
+    # Fire all queries in parallel - total time is ~1 RTT instead of 9
+    tasks = [asyncio.create_task(resolver.resolve(target_domain, record_type))
+             for record_type in record_types]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
 def enumerate_dns(target_domain, output_file=None, verbose=False):
     """
     Enumerate DNS records for a target domain
-    
+
     Args:
         target_domain (str): Domain to enumerate
         output_file (str): Optional output file path
         verbose (bool): Enable verbose output
-    
+
     Returns:
         bool: Success status
     """
     # Comprehensive record types for thorough enumeration
     record_types = ['A', 'AAAA', 'CNAME', 'MX', 'TXT', 'SOA', 'NS', 'PTR', 'SRV']
-    
-    resolver = dns.resolver.Resolver()
-    resolver.timeout = 10
-    resolver.lifetime = 30
-    
+
     results = {}
     total_records = 0
-    
+
     print(f"\n[*] Starting DNS enumeration for: {target_domain}")
     print(f"[*] Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-" * 60)
-    
-    for record_type in record_types:
-        try:
-            if verbose:
-                print(f"[*] Querying {record_type} records...")
-            
-            answer = resolver.resolve(target_domain, record_type)
-            records = []
-            
-            for data in answer:
-                records.append(str(data))
-            
-            if records:
-                results[record_type] = {
-                    'records': records,
-                    'count': len(records),
-                    'ttl': answer.ttl
-                }
-                
-                print(f"\n[+] {record_type} records for {target_domain} ({len(records)} found):")
-                for record in records:
-                    print(f"    {record}")
-                
-                total_records += len(records)
-            
-        except dns.resolver.NoAnswer:
+
+    if verbose:
+        print(f"[*] Querying {len(record_types)} record types concurrently...")
+
+    results_raw = asyncio.run(_enum_async(target_domain, record_types))
+
+    for record_type, answer in zip(record_types, results_raw):
+        if isinstance(answer, dns.resolver.NoAnswer):
             if verbose:
                 print(f"[-] No {record_type} records found")
             continue
-            
-        except dns.resolver.NXDOMAIN:
+
+        if isinstance(answer, dns.resolver.NXDOMAIN):
             print(f"[!] Domain {target_domain} does not exist!")
             return False
-            
-        except dns.resolver.Timeout:
+
+        if isinstance(answer, dns.resolver.Timeout):
             print(f"[!] Timeout querying {record_type} records")
             continue
-            
-        except Exception as e:
-            print(f"[!] Error querying {record_type}: {str(e)}")
+
+        if isinstance(answer, BaseException):
+            print(f"[!] Error querying {record_type}: {str(answer)}")
             continue
-    
+
+        records = []
+        for data in answer:
+            records.append(str(data))
+
+        if records:
+            results[record_type] = {
+                'records': records,
+                'count': len(records),
+                'ttl': answer.ttl
+            }
+
+            print(f"\n[+] {record_type} records for {target_domain} ({len(records)} found):")
+            for record in records:
+                print(f"    {record}")
+
+            total_records += len(records)
+
     # Display summary
     print(f"\n{'='*60}")
     print("DNS ENUMERATION SUMMARY")
@@ -116,9 +141,14 @@ def save_results(domain, results, output_file):
                 'tool': 'DNS Enumeration Tool - Enhanced Version',
                 'repository': 'https://github.com/3UN014/subdomain-enumeration'
             }
-            with open(output_file, 'w') as f:
-                json.dump(output_data, f, indent=2)
-                
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(output_data, f, indent=2)
+
+
         elif output_file.endswith('.csv'):
             with open(output_file, 'w', newline='') as f:
                 writer = csv.writer(f)
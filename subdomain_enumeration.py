@@ -7,39 +7,160 @@ GitHub: https://github.com/3UN014/subdomain-enumeration
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import collections
+import itertools
 import threading
 import argparse
+import os
+import queue
+import random
+import socket
+import string
+import subprocess
 import sys
+import tempfile
 import time
-import socket
+import dns.resolver
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import json
 import csv
 
+# orjson serializes several times faster than stdlib json; fall back if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pandas vectorizes wordlist normalization for very large lists; optional too
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 # Disable SSL warnings for testing purposes
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+class FastAdapter(HTTPAdapter):
+    """HTTPAdapter that disables Nagle and enables keep-alive on new sockets
+
+    Nagle's algorithm can hold small requests back for up to a delayed-ACK
+    interval (~200 ms) - a real tax when the probes are tiny HEAD requests.
+    """
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+class TokenBucket:
+    """Simple thread-safe token bucket for rate limiting
+
+    Refills at `rate` tokens per second up to `capacity`; consume() blocks
+    the calling thread until enough tokens are available. A rate of 0 (or
+    less) disables limiting entirely.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, tokens=1):
+        """Block until the requested tokens are available, then take them"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
+
 class SubdomainEnumerator:
-    def __init__(self, domain, wordlist_file, threads=50, timeout=10, output_file=None, verbose=False):
+    # Keys of each result record, used for incremental CSV output
+    RESULT_FIELDS = ['subdomain', 'http_accessible', 'https_accessible',
+                     'http_status', 'https_status', 'ip_address', 'server',
+                     'dns_only', 'discovered_at']
+
+    # After this many probes of the same IP, trust DNS alone (CDN dedupe)
+    IP_PROBE_LIMIT = 20
+
+    # Candidates submitted to the pool per scheduling pass
+    SUBMIT_BATCH = 64
+
+    def __init__(self, domain, wordlist_file, threads=50, timeout=10, output_file=None,
+                 verbose=False, dns_qps=200, dns_threads=100, backend='threaded',
+                 resolvers_file='resolvers.txt'):
         self.domain = domain
         self.wordlist_file = wordlist_file
         self.max_threads = threads
         self.timeout = timeout
         self.output_file = output_file
         self.verbose = verbose
+        self.dns_qps = dns_qps
+        self.dns_threads = dns_threads
+        self.backend = backend
+        self.resolvers_file = resolvers_file
         
-        # Fixed typo: changed 'discivered_subdomains' to 'discovered_subdomains'
-        self.discovered_subdomains = []
-        self.lock = threading.Lock()
-        
-        # Configure requests session
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SubdomainEnum/2.0 (Educational Tool; +https://github.com/3UN014/subdomain-enumeration)'
-        })
+        # deque.append is atomic under the GIL, so no lock is needed
+        self.discovered_subdomains = collections.deque()
+
+        # One counter dict per worker thread, folded into self.stats at the
+        # end - avoids three lock acquisitions per candidate
+        self._thread_counters = []
+
+        # How often each IP has already been probed - many subdomains behind
+        # one CDN IP behave identically, so probing all of them is redundant
+        self._ip_probe_count = collections.Counter()
+
+        # Dedicated DNS resolver with a shared cache - avoids the blocking,
+        # single-threaded platform resolver behind socket.gethostbyname
+        self.dns_resolver = dns.resolver.Resolver()
+        self.dns_resolver.cache = dns.resolver.LRUCache(10000)
+        self.dns_resolver.nameservers = ['1.1.1.1', '8.8.8.8']
+        self.dns_resolver.timeout = 2
+        self.dns_resolver.lifetime = 4
+
+        # IPs returned for pseudorandom labels on wildcard DNS zones
+        self.wildcard_ips = set()
+
+        # Precompiled format templates - the domain suffix is constant, so
+        # bind it once instead of re-parsing three f-strings per candidate
+        self._fqdn = ('%s.' + domain).__mod__
+        self._http_url = ('http://%s.' + domain).__mod__
+        self._https_url = ('https://%s.' + domain).__mod__
+
+        # requests.Session is not documented as thread-safe, so each worker
+        # thread lazily builds its own session via _make_session()
+        self._tls = threading.local()
+
+        # Cap DNS queries per second - blasting a recursor past its limits
+        # just trades throughput for timeout-induced retries
+        self._dns_bucket = TokenBucket(rate=dns_qps, capacity=dns_qps)
         
+        # Incremental output - discoveries are written as they happen so the
+        # result set never has to sit fully in memory for serialization
+        self._out = None
+        self._csv_writer = None
+        self._out_lock = threading.Lock()
+        if self.output_file:
+            self._open_output()
+
         # Statistics
         self.stats = {
             'tested': 0,
@@ -66,100 +187,322 @@ class SubdomainEnumerator:
         print("-" * 60)
     
     def load_wordlist(self):
-        """Load subdomain wordlist from file"""
+        """Stream unique subdomains from the wordlist file"""
         try:
-            with open(self.wordlist_file, 'r', encoding='utf-8', errors='ignore') as f:
-                subdomains = [line.strip().lower() for line in f if line.strip()]
-            
-            # Remove duplicates
-            unique_subdomains = list(set(subdomains))
-            print(f"[+] Loaded {len(unique_subdomains)} unique subdomains from wordlist")
-            return unique_subdomains
-            
+            wordlist = open(self.wordlist_file, 'r', encoding='utf-8', errors='ignore')
+
         except FileNotFoundError:
             print(f"[!] Wordlist file '{self.wordlist_file}' not found!")
             print("[!] Please ensure the wordlist file exists in the correct path.")
             print("[*] You can download wordlists from:")
             print("    - https://github.com/3UN014/subdomain-enumeration/tree/main/wordlists")
             sys.exit(1)
-            
+
         except Exception as e:
             print(f"[!] Error loading wordlist: {str(e)}")
-            return []
+            return None
+
+        if pd is not None:
+            # Vectorized pipeline: strip/lower/dedupe run in C instead of a
+            # per-line Python loop - 5-10x faster on multi-million-line lists,
+            # at the cost of materializing the list once
+            wordlist.close()
+            try:
+                # keep_default_na/na_filter off: labels like 'null' or 'na'
+                # are real wordlist entries, not missing values
+                words = (pd.read_csv(self.wordlist_file, header=None, names=['w'],
+                                     dtype='string', skip_blank_lines=True,
+                                     keep_default_na=False, na_filter=False,
+                                     encoding='utf-8', encoding_errors='ignore')
+                         .w.str.strip().str.lower())
+                words = words[(words != '') & ~words.str.startswith('#')].drop_duplicates()
+                return iter(words.tolist())
+
+            except Exception as e:
+                if self.verbose:
+                    print(f"[-] Vectorized wordlist load failed ({str(e)}), streaming instead")
+                wordlist = open(self.wordlist_file, 'r', encoding='utf-8', errors='ignore')
+
+        def stream():
+            # Dedupe on the fly instead of materializing set() + list() copies
+            seen = set()
+            with wordlist:
+                for line in wordlist:
+                    subdomain = line.strip().lower()
+                    if subdomain and not subdomain.startswith('#') and subdomain not in seen:
+                        seen.add(subdomain)
+                        yield subdomain
+
+        return stream()
     
-    def check_subdomain(self, subdomain):
-        """Check if subdomain exists and gather information"""
-        full_subdomain = f"{subdomain}.{self.domain}"
-        
+    def _open_output(self):
+        """Open the output file and write any header up front"""
+        try:
+            self._out = open(self.output_file, 'w', newline='')
+            if self.output_file.endswith('.csv'):
+                self._csv_writer = csv.DictWriter(self._out, fieldnames=self.RESULT_FIELDS)
+                self._csv_writer.writeheader()
+            elif not self.output_file.endswith('.json'):
+                self._out.write(f"Subdomain Enumeration Results for {self.domain}\n")
+                self._out.write("Tool: Subdomain Enumeration Tool - Enhanced Version\n")
+                self._out.write("Repository: https://github.com/3UN014/subdomain-enumeration\n")
+                self._out.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                self._out.write("=" * 50 + "\n\n")
+
+        except Exception as e:
+            print(f"[!] Error opening output file: {str(e)}")
+            self._out = None
+
+    def _write_result(self, result):
+        """Append one discovery to the output file"""
+        if self._out is None:
+            return
+
+        with self._out_lock:
+            if self._csv_writer is not None:
+                self._csv_writer.writerow(result)
+            elif self.output_file.endswith('.json'):
+                # NDJSON: one compact record per line, no pretty-print pass
+                if orjson is not None:
+                    self._out.write(orjson.dumps(result).decode() + '\n')
+                else:
+                    self._out.write(json.dumps(result, separators=(',', ':'), default=str) + '\n')
+            else:
+                self._out.write(result['subdomain'] + '\n')
+
+    def _make_session(self):
+        """Build a configured requests session for the calling thread"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'SubdomainEnum/2.0 (Educational Tool; +https://github.com/3UN014/subdomain-enumeration)'
+        })
+
+        # Size the connection pool to the thread count - urllib3's default
+        # pool_maxsize=10 discards connections and forces fresh handshakes
+        adapter = FastAdapter(pool_connections=self.max_threads, pool_maxsize=self.max_threads,
+                              max_retries=Retry(total=0))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _get_session(self):
+        """Return this thread's session, creating it on first use"""
+        session = getattr(self._tls, 'session', None)
+        if session is None:
+            session = self._make_session()
+            self._tls.session = session
+        return session
+
+    def _get_counters(self):
+        """Return this thread's stats counters, creating them on first use"""
+        counters = getattr(self._tls, 'counters', None)
+        if counters is None:
+            counters = {'tested': 0, 'discovered': 0, 'errors': 0}
+            self._tls.counters = counters
+            self._thread_counters.append(counters)  # list.append is atomic
+        return counters
+
+    def _aggregate_stats(self):
+        """Fold the per-thread counters into self.stats"""
+        for key in ('tested', 'discovered', 'errors'):
+            self.stats[key] = sum(counters[key] for counters in self._thread_counters)
+
+    def _detect_wildcard(self):
+        """Detect wildcard DNS by resolving pseudorandom labels"""
+        for _ in range(3):
+            random_label = ''.join(random.choices(string.ascii_lowercase, k=16))
+            try:
+                answer = self.dns_resolver.resolve(self._fqdn(random_label), 'A')
+                self.wildcard_ips.update(record.address for record in answer)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer,
+                    dns.resolver.NoNameservers, dns.resolver.Timeout):
+                # Random label doesn't resolve - no wildcard on this try
+                continue
+
+        if self.wildcard_ips:
+            print(f"[!] Wildcard DNS detected! Ignoring candidates resolving to: "
+                  f"{', '.join(sorted(self.wildcard_ips))}")
+
+    def _run_massdns(self, subdomains):
+        """Bulk-resolve all candidates with massdns
+
+        Writes the candidate FQDNs to a temp file, runs massdns against the
+        configured resolvers file and parses its NDJSON output. Returns a
+        list of (label, ip) pairs for candidates that resolved, or None if
+        massdns is unavailable or fails.
+        """
+        fqdn_file = tempfile.NamedTemporaryFile('w', prefix='massdns_', suffix='.txt',
+                                                delete=False)
+        out_file = fqdn_file.name + '.json'
+
+        count = 0
+        with fqdn_file:
+            for subdomain in subdomains:
+                fqdn_file.write(self._fqdn(subdomain) + '\n')
+                count += 1
+
+        print(f"[*] Bulk-resolving {count} candidates with massdns...")
+
+        try:
+            subprocess.run(['massdns', '-r', self.resolvers_file, '-t', 'A',
+                            '-o', 'J', '-w', out_file, '-q', fqdn_file.name],
+                           check=True)
+
+            survivors = []
+            suffix = '.' + self.domain + '.'
+            with open(out_file) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+
+                    if record.get('status') != 'NOERROR':
+                        continue
+
+                    name = record.get('name', '')
+                    label = name[:-len(suffix)] if name.endswith(suffix) else name.rstrip('.')
+                    for answer in record.get('data', {}).get('answers', []):
+                        if answer.get('type') == 'A':
+                            survivors.append((label, answer.get('data')))
+                            break
+            return survivors
+
+        except FileNotFoundError:
+            print("[!] massdns binary not found, falling back to the built-in resolver")
+            return None
+
+        except subprocess.CalledProcessError as e:
+            print(f"[!] massdns failed ({str(e)}), falling back to the built-in resolver")
+            return None
+
+        finally:
+            for path in (fqdn_file.name, out_file):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def _resolve_candidate(self, subdomain):
+        """DNS stage: resolve one candidate to an IP address
+
+        Honors the DNS rate limit; returns None when the candidate doesn't
+        exist or resolution fails.
+        """
+        counters = self._get_counters()
+        counters['tested'] += 1
+
+        try:
+            self._dns_bucket.consume()
+            answer = self.dns_resolver.resolve(self._fqdn(subdomain), 'A')
+            return answer[0].address
+
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer,
+                dns.resolver.NoNameservers, dns.resolver.Timeout):
+            # If DNS resolution fails, subdomain doesn't exist
+            return None
+
+        except Exception as e:
+            counters['errors'] += 1
+            if self.verbose:
+                print(f"[-] Error resolving {self._fqdn(subdomain)}: {str(e)}")
+            return None
+
+    def _probe_candidate(self, subdomain, ip_address):
+        """HTTP stage: probe a resolved candidate and record any discovery"""
+        full_subdomain = self._fqdn(subdomain)
+
         result = {
             'subdomain': full_subdomain,
             'http_accessible': False,
             'https_accessible': False,
             'http_status': None,
             'https_status': None,
-            'ip_address': None,
+            'ip_address': ip_address,
             'server': None,
+            'dns_only': False,
             'discovered_at': datetime.now().isoformat()
         }
-        
-        with self.lock:
-            self.stats['tested'] += 1
-        
+
+        counters = self._get_counters()
+
         try:
-            # Try to resolve IP address first
-            try:
-                ip_address = socket.gethostbyname(full_subdomain)
-                result['ip_address'] = ip_address
-            except socket.gaierror:
-                # If DNS resolution fails, subdomain doesn't exist
+            # Wildcard zones resolve every label - skip before wasting HTTP probes
+            if ip_address in self.wildcard_ips:
                 return None
-            
-            # Test HTTP
-            try:
-                http_url = f"http://{full_subdomain}"
-                response = self.session.get(http_url, timeout=self.timeout, allow_redirects=True)
-                result['http_accessible'] = True
-                result['http_status'] = response.status_code
-                result['server'] = response.headers.get('Server', 'Unknown')
-            except requests.RequestException:
-                pass
-            
-            # Test HTTPS
+
+            # This IP has been probed plenty already (typical for CDN fronts);
+            # DNS confirmed existence, so record it without more HTTP traffic
+            if self._ip_probe_count[ip_address] > self.IP_PROBE_LIMIT:
+                result['dns_only'] = True
+                self.discovered_subdomains.append(result)
+                counters['discovered'] += 1
+                self._write_result(result)
+                print(f"[+] Found: {full_subdomain} [DNS-only] [{ip_address}]")
+                return result
+
+            session = self._get_session()
+
+            # Probe with HEAD (headers only, no redirects) - we only need the
+            # status code and Server header. HTTPS first; most live hosts serve
+            # it, and a connection-level failure falls back to plain HTTP.
             try:
-                https_url = f"https://{full_subdomain}"
-                response = self.session.get(https_url, timeout=self.timeout, allow_redirects=True, verify=False)
+                https_url = self._https_url(subdomain)
+                response = session.head(https_url, timeout=self.timeout,
+                                        allow_redirects=False, verify=False)
                 result['https_accessible'] = True
                 result['https_status'] = response.status_code
-                if not result['server'] or result['server'] == 'Unknown':
+                result['server'] = response.headers.get('Server', 'Unknown')
+            except (requests.exceptions.SSLError, requests.exceptions.ConnectionError):
+                try:
+                    http_url = self._http_url(subdomain)
+                    response = session.head(http_url, timeout=self.timeout,
+                                            allow_redirects=False)
+                    result['http_accessible'] = True
+                    result['http_status'] = response.status_code
                     result['server'] = response.headers.get('Server', 'Unknown')
+                except requests.RequestException:
+                    pass
             except requests.RequestException:
                 pass
-            
+
             # If either HTTP or HTTPS worked, it's a valid subdomain
             if result['http_accessible'] or result['https_accessible']:
-                with self.lock:
-                    self.discovered_subdomains.append(result)
-                    self.stats['discovered'] += 1
-                
+                self._ip_probe_count[ip_address] += 1
+                self.discovered_subdomains.append(result)
+                counters['discovered'] += 1
+                self._write_result(result)
+
                 # Display immediate results
                 status_parts = []
                 if result['http_accessible']:
                     status_parts.append(f"HTTP:{result['http_status']}")
                 if result['https_accessible']:
                     status_parts.append(f"HTTPS:{result['https_status']}")
-                
+
                 status_str = " | ".join(status_parts)
                 print(f"[+] Found: {full_subdomain} [{status_str}] [{result['ip_address']}]")
-                
+
                 return result
-                
+
         except Exception as e:
-            with self.lock:
-                self.stats['errors'] += 1
+            counters['errors'] += 1
             if self.verbose:
                 print(f"[-] Error checking {full_subdomain}: {str(e)}")
-        
+
         return None
+
+    def check_subdomain(self, subdomain, resolved_ip=None):
+        """Check if subdomain exists and gather information"""
+        if resolved_ip is None:
+            resolved_ip = self._resolve_candidate(subdomain)
+            if resolved_ip is None:
+                return None
+        else:
+            # The DNS phase already ran elsewhere (e.g. massdns)
+            self._get_counters()['tested'] += 1
+
+        return self._probe_candidate(subdomain, resolved_ip)
     
     def enumerate_subdomains(self):
         """Main enumeration function"""
@@ -167,25 +510,78 @@ class SubdomainEnumerator:
         
         # Load wordlist
         subdomains = self.load_wordlist()
-        if not subdomains:
+        if subdomains is None:
             print("[!] No subdomains to test!")
             return
-        
-        print(f"[*] Starting enumeration with {len(subdomains)} subdomains...")
-        print(f"[*] Using {self.max_threads} threads\n")
-        
-        # Use ThreadPoolExecutor for controlled threading
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            # Submit all tasks
-            futures = [executor.submit(self.check_subdomain, sub) for sub in subdomains]
-            
-            # Wait for completion (optional progress tracking)
-            for future in futures:
-                try:
-                    future.result()
-                except Exception as e:
-                    if self.verbose:
-                        print(f"[!] Task error: {str(e)}")
+
+        # Probe random labels first so wildcard zones don't flood the results
+        self._detect_wildcard()
+
+        # The massdns backend does the whole DNS phase up front; otherwise a
+        # dedicated DNS pool resolves candidates and feeds the HTTP pool below
+        pre_resolved = None
+        if self.backend == 'massdns':
+            pre_resolved = self._run_massdns(subdomains)
+            if pre_resolved is not None:
+                print(f"[*] {len(pre_resolved)} candidates survived DNS, probing over HTTP...")
+            else:
+                subdomains = self.load_wordlist()
+
+        print(f"[*] Starting enumeration (streaming wordlist)...")
+        print(f"[*] Using {self.dns_threads} DNS threads and {self.max_threads} HTTP threads\n")
+
+        # Resolved candidates flow through a bounded queue from the DNS pool
+        # to the HTTP pool, so slow web servers never stall DNS discovery
+        resolved_queue = queue.Queue(maxsize=self.max_threads * 2)
+
+        def dns_task(subdomain):
+            ip_address = self._resolve_candidate(subdomain)
+            if ip_address is not None:
+                resolved_queue.put((subdomain, ip_address))
+
+        def http_worker():
+            while True:
+                item = resolved_queue.get()
+                if item is None:
+                    break
+                self._probe_candidate(*item)
+
+        with ThreadPoolExecutor(max_workers=self.max_threads) as http_pool:
+            consumers = [http_pool.submit(http_worker) for _ in range(self.max_threads)]
+
+            try:
+                if pre_resolved is not None:
+                    counters = self._get_counters()
+                    for item in pre_resolved:
+                        counters['tested'] += 1
+                        resolved_queue.put(item)
+                else:
+                    # Keep at most 2x pool-size futures in flight so memory
+                    # stays bounded no matter how large the wordlist is
+                    max_pending = self.dns_threads * 2
+
+                    with ThreadPoolExecutor(max_workers=self.dns_threads) as dns_pool:
+                        pending = set()
+                        while True:
+                            # Submit in batches so the wait/reap bookkeeping runs
+                            # once per SUBMIT_BATCH candidates, not per candidate
+                            batch = list(itertools.islice(subdomains, self.SUBMIT_BATCH))
+                            if not batch:
+                                break
+
+                            pending.update(dns_pool.submit(dns_task, subdomain)
+                                           for subdomain in batch)
+                            while len(pending) >= max_pending:
+                                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                                self._reap(done)
+
+                        self._reap(pending)
+            finally:
+                # DNS phase done - one shutdown sentinel per HTTP worker
+                for _ in range(self.max_threads):
+                    resolved_queue.put(None)
+
+            self._reap(consumers)
         
         print(f"\n[*] Enumeration completed!")
         self.display_summary()
@@ -194,8 +590,18 @@ class SubdomainEnumerator:
         if self.output_file:
             self.save_results()
     
+    def _reap(self, futures):
+        """Collect finished futures, surfacing task errors in verbose mode"""
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                if self.verbose:
+                    print(f"[!] Task error: {str(e)}")
+
     def display_summary(self):
         """Display enumeration summary"""
+        self._aggregate_stats()
         elapsed_time = time.time() - self.stats['start_time']
         
         print(f"\n{'='*60}")
@@ -217,48 +623,27 @@ class SubdomainEnumerator:
                     status_parts.append(f"HTTP:{result['http_status']}")
                 if result['https_accessible']:
                     status_parts.append(f"HTTPS:{result['https_status']}")
-                
+                if result['dns_only']:
+                    status_parts.append("DNS-only")
+
                 status_str = " | ".join(status_parts)
                 print(f"  {result['subdomain']} [{status_str}] [{result['ip_address']}]")
         
         print(f"\n[*] Repository: https://github.com/3UN014/subdomain-enumeration")
     
     def save_results(self):
-        """Save results to file"""
+        """Flush and close the incrementally-written output file"""
+        if self._out is None:
+            return
+
         try:
-            if self.output_file.endswith('.json'):
-                output_data = {
-                    'domain': self.domain,
-                    'timestamp': datetime.now().isoformat(),
-                    'statistics': self.stats,
-                    'discovered_subdomains': self.discovered_subdomains,
-                    'tool': 'Subdomain Enumeration Tool - Enhanced Version',
-                    'repository': 'https://github.com/3UN014/subdomain-enumeration'
-                }
-                with open(self.output_file, 'w') as f:
-                    json.dump(output_data, f, indent=2, default=str)
-            
-            elif self.output_file.endswith('.csv'):
-                with open(self.output_file, 'w', newline='') as f:
-                    if self.discovered_subdomains:
-                        fieldnames = self.discovered_subdomains[0].keys()
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(self.discovered_subdomains)
-            
-            else:  # Default to text format
-                with open(self.output_file, 'w') as f:
-                    f.write(f"Subdomain Enumeration Results for {self.domain}\n")
-                    f.write(f"Tool: Subdomain Enumeration Tool - Enhanced Version\n")
-                    f.write(f"Repository: https://github.com/3UN014/subdomain-enumeration\n")
-                    f.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("=" * 50 + "\n\n")
-                    
-                    for result in self.discovered_subdomains:
-                        f.write(f"{result['subdomain']}\n")
-            
+            with self._out_lock:
+                self._out.close()
+                self._out = None
+                self._csv_writer = None
+
             print(f"[+] Results saved to: {self.output_file}")
-            
+
         except Exception as e:
             print(f"[!] Error saving results: {str(e)}")
 
@@ -274,6 +659,14 @@ def main():
     parser.add_argument('-w', '--wordlist', default='wordlists/subdomains.txt', help='Wordlist file (default: wordlists/subdomains.txt)')
     parser.add_argument('-t', '--threads', type=int, default=50, help='Number of threads (default: 50)')
     parser.add_argument('--timeout', type=int, default=10, help='Request timeout in seconds (default: 10)')
+    parser.add_argument('--dns-qps', type=int, default=200,
+                        help='Max DNS queries per second, 0 for unlimited (default: 200)')
+    parser.add_argument('--dns-threads', type=int, default=100,
+                        help='Size of the DNS resolver thread pool (default: 100)')
+    parser.add_argument('--backend', choices=['threaded', 'massdns'], default='threaded',
+                        help='DNS backend: built-in threaded resolver or bulk massdns (default: threaded)')
+    parser.add_argument('--resolvers', default='resolvers.txt',
+                        help='Resolvers file for the massdns backend (default: resolvers.txt)')
     parser.add_argument('-o', '--output', help='Output file (supports .txt, .json, .csv)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output')
     parser.add_argument('--version', action='version', version='Subdomain Enumeration Tool v2.0')
@@ -287,7 +680,11 @@ def main():
         threads=args.threads,
         timeout=args.timeout,
         output_file=args.output,
-        verbose=args.verbose
+        verbose=args.verbose,
+        dns_qps=args.dns_qps,
+        dns_threads=args.dns_threads,
+        backend=args.backend,
+        resolvers_file=args.resolvers
     )
     
     try:
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Subdomain Enumeration Project
+In-process pytest tests - no subprocesses, no network
+"""
+
+import json
+import os
+import sys
+
+import dns.asyncresolver
+import dns.resolver
+import pytest
+
+# The tools live at the repository root, one level up from tests/
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import dns_enumeration
+from subdomain_enumeration import SubdomainEnumerator, TokenBucket
+
+
+class FakeRecord:
+    def __init__(self, address):
+        self.address = address
+
+    def __str__(self):
+        return self.address
+
+
+class FakeAnswer:
+    ttl = 300
+
+    def __init__(self, addresses):
+        self._records = [FakeRecord(address) for address in addresses]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+
+def test_file_structure():
+    """All files the README promises should exist"""
+    required_files = [
+        'dns_enumeration.py',
+        'subdomain_enumeration.py',
+        'wordlists/subdomains.txt',
+        'requirements.txt',
+        'README.md',
+        'LICENSE',
+        '.gitignore',
+    ]
+    for file in required_files:
+        assert os.path.exists(os.path.join(REPO_ROOT, file)), f"{file} missing"
+
+
+def test_wordlist_has_enough_entries():
+    """Shipped wordlist should have a usable number of entries"""
+    wordlist_file = os.path.join(REPO_ROOT, 'wordlists', 'subdomains.txt')
+    with open(wordlist_file, 'r') as f:
+        lines = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    assert len(lines) >= 50
+
+
+def test_enumerate_dns_success(monkeypatch):
+    """enumerate_dns reports success with a stubbed resolver, no network"""
+    async def fake_resolve(self, domain, record_type):
+        if record_type == 'A':
+            return FakeAnswer(['93.184.216.34'])
+        raise dns.resolver.NoAnswer()
+
+    monkeypatch.setattr(dns.asyncresolver.Resolver, 'resolve', fake_resolve)
+    assert dns_enumeration.enumerate_dns('example.com') is True
+
+
+def test_enumerate_dns_nxdomain(monkeypatch):
+    """A non-existent domain should fail cleanly"""
+    async def fake_resolve(self, domain, record_type):
+        raise dns.resolver.NXDOMAIN
+
+    monkeypatch.setattr(dns.asyncresolver.Resolver, 'resolve', fake_resolve)
+    assert dns_enumeration.enumerate_dns('does-not-exist.invalid') is False
+
+
+def make_enumerator(tmp_path, **kwargs):
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text('www\nMail\nwww\n\nnull\n# a comment\nftp\n')
+    return SubdomainEnumerator('example.com', str(wordlist), **kwargs)
+
+
+def test_load_wordlist_streams_unique(tmp_path):
+    """Entries come back lowercased, deduped, comments skipped, NA-like
+    labels such as 'null' preserved - regardless of the pandas fast path"""
+    enumerator = make_enumerator(tmp_path)
+    assert list(enumerator.load_wordlist()) == ['www', 'mail', 'null', 'ftp']
+
+
+def test_check_subdomain_skips_wildcard_ip(tmp_path, monkeypatch):
+    """Candidates resolving to a known wildcard IP are dropped"""
+    enumerator = make_enumerator(tmp_path)
+    enumerator.wildcard_ips = {'1.2.3.4'}
+    monkeypatch.setattr(enumerator.dns_resolver, 'resolve',
+                        lambda *a, **k: FakeAnswer(['1.2.3.4']))
+
+    assert enumerator.check_subdomain('www') is None
+    assert len(enumerator.discovered_subdomains) == 0
+
+
+def test_check_subdomain_records_discovery(tmp_path, monkeypatch):
+    """A resolving, HTTPS-answering candidate is recorded as discovered"""
+    class FakeResponse:
+        status_code = 200
+        headers = {'Server': 'nginx'}
+
+    class FakeSession:
+        def head(self, url, **kwargs):
+            return FakeResponse()
+
+    enumerator = make_enumerator(tmp_path)
+    monkeypatch.setattr(enumerator.dns_resolver, 'resolve',
+                        lambda *a, **k: FakeAnswer(['5.6.7.8']))
+    monkeypatch.setattr(enumerator, '_get_session', lambda: FakeSession())
+
+    result = enumerator.check_subdomain('www')
+    assert result['subdomain'] == 'www.example.com'
+    assert result['https_accessible'] is True
+    assert result['https_status'] == 200
+    assert result['server'] == 'nginx'
+    assert len(enumerator.discovered_subdomains) == 1
+
+
+def test_check_subdomain_dns_only_past_probe_limit(tmp_path, monkeypatch):
+    """Once an IP is over the probe limit, discovery skips HTTP entirely"""
+    enumerator = make_enumerator(tmp_path)
+    monkeypatch.setattr(enumerator.dns_resolver, 'resolve',
+                        lambda *a, **k: FakeAnswer(['5.6.7.8']))
+    monkeypatch.setattr(enumerator, '_get_session',
+                        lambda: pytest.fail('HTTP probe should be skipped'))
+    enumerator._ip_probe_count['5.6.7.8'] = enumerator.IP_PROBE_LIMIT + 1
+
+    result = enumerator.check_subdomain('www')
+    assert result['dns_only'] is True
+    assert len(enumerator.discovered_subdomains) == 1
+
+
+def test_token_bucket_zero_rate_is_unlimited():
+    """--dns-qps 0 must mean unlimited, not a crash per candidate"""
+    bucket = TokenBucket(0)
+    for _ in range(1000):
+        bucket.consume()
+
+
+def test_check_subdomain_uses_preresolved_ip(tmp_path, monkeypatch):
+    """A massdns-resolved candidate skips the in-worker DNS lookup"""
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+
+    class FakeSession:
+        def head(self, url, **kwargs):
+            return FakeResponse()
+
+    enumerator = make_enumerator(tmp_path)
+    monkeypatch.setattr(enumerator.dns_resolver, 'resolve',
+                        lambda *a, **k: pytest.fail('DNS lookup should be skipped'))
+    monkeypatch.setattr(enumerator, '_get_session', lambda: FakeSession())
+
+    result = enumerator.check_subdomain('www', resolved_ip='5.6.7.8')
+    assert result['ip_address'] == '5.6.7.8'
+    assert result['https_accessible'] is True
+
+
+def test_incremental_json_output(tmp_path, monkeypatch):
+    """Discoveries land in the .json output file as NDJSON lines"""
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+
+    class FakeSession:
+        def head(self, url, **kwargs):
+            return FakeResponse()
+
+    output_file = tmp_path / 'results.json'
+    enumerator = make_enumerator(tmp_path, output_file=str(output_file))
+    monkeypatch.setattr(enumerator.dns_resolver, 'resolve',
+                        lambda *a, **k: FakeAnswer(['5.6.7.8']))
+    monkeypatch.setattr(enumerator, '_get_session', lambda: FakeSession())
+
+    enumerator.check_subdomain('www')
+    enumerator.save_results()
+
+    lines = output_file.read_text().splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record['subdomain'] == 'www.example.com'
+    assert record['ip_address'] == '5.6.7.8'